@@ -1,5 +1,5 @@
 import argparse
-from typing import Union
+from typing import Any, Callable, Dict, Text, Tuple, Union
 
 from rasa.cli.arguments.default_arguments import (
     add_config_param,
@@ -10,96 +10,208 @@ from rasa.cli.arguments.default_arguments import (
 )
 from rasa.shared.constants import DEFAULT_CONFIG_PATH, DEFAULT_DATA_PATH
 
+# Multi-value argument defaults. They are stored as tuples and handed to argparse
+# as fresh lists so that parsers never share a mutable default.
+_DEFAULT_DATA = (DEFAULT_DATA_PATH,)
+_DEFAULT_CORE_CONFIG = (DEFAULT_CONFIG_PATH,)
+_DEFAULT_PERCENTAGES = (0, 25, 50, 75)
+
+# Flags and `add_argument` options of the arguments owned by this module. The
+# `_TRAIN_*_PARAMS` tables below refer to them by key.
+_ARGUMENTS: Dict[Text, Tuple[Tuple[Text, ...], Dict[Text, Any]]] = {
+    "force": (
+        ("--force",),
+        {
+            "action": "store_true",
+            "help": "Force a model training even if the data has not changed.",
+        },
+    ),
+    "data": (
+        ("--data",),
+        {
+            "default": _DEFAULT_DATA,
+            "nargs": "+",
+            "help": "Paths to the Core and NLU data files.",
+        },
+    ),
+    "core_config": (
+        ("-c", "--config"),
+        {
+            "nargs": "+",
+            # `rasa train core` checks for a `list` to detect multiple configs,
+            # `_add_params` builds a fresh one for every parser
+            "default": _DEFAULT_CORE_CONFIG,
+            "help": "The policy and NLU pipeline configuration of your bot. "
+            "If multiple configuration files are provided, multiple Rasa Core "
+            "models are trained to compare policies.",
+        },
+    ),
+    "percentages": (
+        ("--percentages",),
+        {
+            "nargs": "*",
+            "type": int,
+            "default": _DEFAULT_PERCENTAGES,
+            "help": "Range of exclusion percentages.",
+        },
+    ),
+    "runs": (
+        ("--runs",),
+        {"type": int, "default": 3, "help": "Number of runs for experiments."},
+    ),
+    "dry_run": (
+        ("--dry-run",),
+        {
+            "default": False,
+            "action": "store_true",
+            "help": "If enabled, no actual training will be performed. Instead, "
+            "it will be determined whether a model should be re-trained "
+            "and this information will be printed as the output. The return "
+            "code is a 4-bit bitmask that can also be used to determine what "
+            "exactly needs to be retrained:\n"
+            "- 1 means Core needs to be retrained\n"
+            "- 2 means NLU needs to be retrained\n"
+            "- 4 means responses in the domain should be updated\n"
+            "- 8 means the training was forced (--force argument is specified)",
+        },
+    ),
+    "augmentation": (
+        ("--augmentation",),
+        {
+            "type": int,
+            "default": 50,
+            "help": "How much data augmentation to use during training.",
+        },
+    ),
+    "debug_plots": (
+        ("--debug-plots",),
+        {
+            "default": False,
+            "action": "store_true",
+            "help": "If enabled, will create plots showing checkpoints "
+            "and their connections between story blocks in a  "
+            "file called `story_blocks_connections.html`.",
+        },
+    ),
+    "num_threads": (
+        ("--num-threads",),
+        {
+            "type": int,
+            "default": 1,
+            "help": "Maximum amount of threads to use when training.",
+        },
+    ),
+    "fixed_model_name": (
+        ("--fixed-model-name",),
+        {
+            "type": str,
+            "help": "If set, the name of the model file/directory will be set to "
+            "the given name.",
+        },
+    ),
+    "persist_nlu_data": (
+        ("--persist-nlu-data",),
+        {
+            "action": "store_true",
+            "help": "Persist the nlu training data in the saved model.",
+        },
+    ),
+}
+
+_OUT_HELP_TEXT = "Directory where your models should be stored."
+
+# Arguments of the `rasa train` subcommands in the order they are added. Strings
+# are keys of `_ARGUMENTS`, pairs are helpers from `default_arguments` together
+# with the keyword arguments they are called with.
+_TRAIN_PARAMS = (
+    "data",
+    (add_config_param, {}),
+    (add_domain_param, {}),
+    (add_out_param, {"help_text": _OUT_HELP_TEXT}),
+    "dry_run",
+    "augmentation",
+    "debug_plots",
+    "num_threads",
+    "fixed_model_name",
+    "persist_nlu_data",
+    "force",
+)
 
-def set_train_arguments(parser: argparse.ArgumentParser):
-    add_data_param(parser)
-    add_config_param(parser)
-    add_domain_param(parser)
-    add_out_param(parser, help_text="Directory where your models should be stored.")
+_TRAIN_CORE_PARAMS = (
+    (add_stories_param, {}),
+    (add_domain_param, {}),
+    "core_config",
+    (add_out_param, {"help_text": _OUT_HELP_TEXT}),
+    "augmentation",
+    "debug_plots",
+    "force",
+    "fixed_model_name",
+)
 
-    add_dry_run_param(parser)
-    add_augmentation_param(parser)
-    add_debug_plots_param(parser)
+_TRAIN_NLU_PARAMS = (
+    (add_config_param, {}),
+    (add_domain_param, {"default": None}),
+    (add_out_param, {"help_text": _OUT_HELP_TEXT}),
+    (add_nlu_data_param, {"help_text": "File or folder containing your NLU data."}),
+    "num_threads",
+    "fixed_model_name",
+    "persist_nlu_data",
+)
 
-    add_num_threads_param(parser)
 
-    add_model_name_param(parser)
-    add_persist_nlu_data_param(parser)
-    add_force_param(parser)
+def set_train_arguments(parser: argparse.ArgumentParser):
+    _add_params(parser, _TRAIN_PARAMS)
 
 
 def set_train_core_arguments(parser: argparse.ArgumentParser):
-    add_stories_param(parser)
-    add_domain_param(parser)
-    add_core_config_param(parser)
-    add_out_param(parser, help_text="Directory where your models should be stored.")
-
-    add_augmentation_param(parser)
-    add_debug_plots_param(parser)
-
-    add_force_param(parser)
-
-    add_model_name_param(parser)
+    _add_params(parser, _TRAIN_CORE_PARAMS)
 
     compare_arguments = parser.add_argument_group("Comparison Arguments")
     add_compare_params(compare_arguments)
 
 
 def set_train_nlu_arguments(parser: argparse.ArgumentParser):
-    add_config_param(parser)
-    add_domain_param(parser, default=None)
-    add_out_param(parser, help_text="Directory where your models should be stored.")
+    _add_params(parser, _TRAIN_NLU_PARAMS)
 
-    add_nlu_data_param(parser, help_text="File or folder containing your NLU data.")
 
-    add_num_threads_param(parser)
+def _add_params(
+    parser: Union[argparse.ArgumentParser, argparse._ActionsContainer],
+    params: Tuple[Union[Text, Tuple[Callable[..., None], Dict[Text, Any]]], ...],
+) -> None:
+    """Adds the arguments described by `params` to a specified `parser`.
 
-    add_model_name_param(parser)
-    add_persist_nlu_data_param(parser)
+    Args:
+        parser: An instance of `ArgumentParser` or `_ActionsContainer`.
+        params: Keys of `_ARGUMENTS` or pairs of an `add_*_param` function and the
+            keyword arguments it should be called with.
+    """
+    for param in params:
+        if isinstance(param, str):
+            flags, kwargs = _ARGUMENTS[param]
+            if isinstance(kwargs.get("default"), tuple):
+                kwargs = {**kwargs, "default": list(kwargs["default"])}
+            parser.add_argument(*flags, **kwargs)
+        else:
+            add_param, kwargs = param
+            add_param(parser, **kwargs)
 
 
 def add_force_param(parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]):
-    parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Force a model training even if the data has not changed.",
-    )
+    _add_params(parser, ("force",))
 
 
 def add_data_param(parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]):
-    parser.add_argument(
-        "--data",
-        default=[DEFAULT_DATA_PATH],
-        nargs="+",
-        help="Paths to the Core and NLU data files.",
-    )
+    _add_params(parser, ("data",))
 
 
 def add_core_config_param(parser: argparse.ArgumentParser):
-    parser.add_argument(
-        "-c",
-        "--config",
-        nargs="+",
-        default=[DEFAULT_CONFIG_PATH],
-        help="The policy and NLU pipeline configuration of your bot. "
-        "If multiple configuration files are provided, multiple Rasa Core "
-        "models are trained to compare policies.",
-    )
+    _add_params(parser, ("core_config",))
 
 
 def add_compare_params(
     parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
 ):
-    parser.add_argument(
-        "--percentages",
-        nargs="*",
-        type=int,
-        default=[0, 25, 50, 75],
-        help="Range of exclusion percentages.",
-    )
-    parser.add_argument(
-        "--runs", type=int, default=3, help="Number of runs for experiments."
-    )
+    _add_params(parser, ("percentages", "runs"))
 
 
 def add_dry_run_param(
@@ -110,20 +222,7 @@ def add_dry_run_param(
     Args:
         parser: An instance of `ArgumentParser` or `_ActionsContainer`.
     """
-    parser.add_argument(
-        "--dry-run",
-        default=False,
-        action="store_true",
-        help="If enabled, no actual training will be performed. Instead, "
-        "it will be determined whether a model should be re-trained "
-        "and this information will be printed as the output. The return "
-        "code is a 4-bit bitmask that can also be used to determine what exactly needs "
-        "to be retrained:\n"
-        "- 1 means Core needs to be retrained\n"
-        "- 2 means NLU needs to be retrained\n"
-        "- 4 means responses in the domain should be updated\n"
-        "- 8 means the training was forced (--force argument is specified)",
-    )
+    _add_params(parser, ("dry_run",))
 
 
 def add_augmentation_param(
@@ -134,52 +233,26 @@ def add_augmentation_param(
     Args:
         parser: An instance of `ArgumentParser` or `_ActionsContainer`.
     """
-    parser.add_argument(
-        "--augmentation",
-        type=int,
-        default=50,
-        help="How much data augmentation to use during training.",
-    )
+    _add_params(parser, ("augmentation",))
 
 
 def add_debug_plots_param(
     parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
 ):
-    parser.add_argument(
-        "--debug-plots",
-        default=False,
-        action="store_true",
-        help="If enabled, will create plots showing checkpoints "
-        "and their connections between story blocks in a  "
-        "file called `story_blocks_connections.html`.",
-    )
+    _add_params(parser, ("debug_plots",))
 
 
 def add_num_threads_param(
     parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
 ):
-    parser.add_argument(
-        "--num-threads",
-        type=int,
-        default=1,
-        help="Maximum amount of threads to use when training.",
-    )
+    _add_params(parser, ("num_threads",))
 
 
 def add_model_name_param(parser: argparse.ArgumentParser):
-    parser.add_argument(
-        "--fixed-model-name",
-        type=str,
-        help="If set, the name of the model file/directory will be set to the given "
-        "name.",
-    )
+    _add_params(parser, ("fixed_model_name",))
 
 
 def add_persist_nlu_data_param(
     parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
 ):
-    parser.add_argument(
-        "--persist-nlu-data",
-        action="store_true",
-        help="Persist the nlu training data in the saved model.",
-    )
+    _add_params(parser, ("persist_nlu_data",))
@@ -1,3 +1,4 @@
+import argparse
 import os
 import tempfile
 from pathlib import Path
@@ -17,12 +18,16 @@ from rasa.train import (
     CODE_FORCED_TRAINING,
 )
 
+import rasa.cli.arguments.train as train_arguments
+
 # noinspection PyProtectedMember
 from rasa.cli.train import _get_valid_config
 from rasa.shared.constants import (
     CONFIG_MANDATORY_KEYS_CORE,
     CONFIG_MANDATORY_KEYS_NLU,
     CONFIG_MANDATORY_KEYS,
+    DEFAULT_CONFIG_PATH,
+    DEFAULT_DATA_PATH,
     LATEST_TRAINING_DATA_FORMAT_VERSION,
 )
 
@@ -411,6 +416,30 @@ def test_train_nlu_help(run: Callable[..., RunResult]):
         assert line in printed_help
 
 
+def test_train_default_arguments():
+    parser = argparse.ArgumentParser()
+    train_arguments.set_train_arguments(parser)
+
+    args = parser.parse_args([])
+
+    assert args.data == [DEFAULT_DATA_PATH]
+
+
+def test_train_core_default_arguments():
+    parser = argparse.ArgumentParser()
+    train_arguments.set_train_core_arguments(parser)
+    other_parser = argparse.ArgumentParser()
+    train_arguments.set_train_core_arguments(other_parser)
+
+    args = parser.parse_args([])
+
+    assert args.config == [DEFAULT_CONFIG_PATH]
+    assert args.percentages == [0, 25, 50, 75]
+    # parsers must not share mutable defaults
+    assert args.config is not other_parser.parse_args([]).config
+    assert args.percentages is not other_parser.parse_args([]).percentages
+
+
 def test_train_core_help(run: Callable[..., RunResult]):
     output = run("train", "core", "--help")
 
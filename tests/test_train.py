@@ -1,9 +1,8 @@
-import asyncio
 import sys
 import tempfile
 import os
 from pathlib import Path
-from typing import Text, Dict
+from typing import Any, Callable, Coroutine, Text, Dict, Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -20,6 +19,28 @@ from tests.conftest import DEFAULT_CONFIG_PATH, DEFAULT_NLU_DATA
 from tests.core.conftest import DEFAULT_DOMAIN_PATH_WITH_SLOTS, DEFAULT_STORIES_FILE
 from tests.core.test_model import _fingerprint
 
+# Patching is bit more complicated as we have a module `train` and function
+# with the same name 😬
+_rasa_train_module = sys.modules["rasa.train"]
+
+
+def _as_coroutine(mock: Mock) -> Callable[..., Coroutine]:
+    """Wraps `mock` in a coroutine function which returns the mock's result."""
+
+    async def patched(*args: Any, **kwargs: Any) -> Any:
+        return mock(*args, **kwargs)
+
+    return patched
+
+
+def _patch_train(
+    monkeypatch: MonkeyPatch, name: Text, return_value: Any = None
+) -> None:
+    """Replaces the coroutine `name` of `rasa.train` with a mock."""
+    monkeypatch.setattr(
+        _rasa_train_module, name, _as_coroutine(Mock(return_value=return_value))
+    )
+
 
 @pytest.mark.parametrize(
     "parameters",
@@ -54,36 +75,40 @@ def test_package_model(trained_rasa_model: Text, parameters: Dict):
     assert file_name.endswith(".tar.gz")
 
 
+@pytest.fixture
+def train_scratch(tmp_path: Path) -> Tuple[Path, Path]:
+    """Creates the temporary training and model output directories."""
+    training = tmp_path / "training"
+    models = tmp_path / "models"
+    training.mkdir()
+    models.mkdir()
+    return training, models
+
+
 def count_temp_rasa_files(directory: Text) -> int:
-    return len(
-        [
-            entry
-            for entry in os.listdir(directory)
-            if not any(
-                [
-                    # Ignore the following files/directories:
-                    entry == "__pycache__",  # Python bytecode
-                    entry.endswith(".py")  # Temp .py files created by TF
-                    # Anything else is considered to be created by Rasa
-                ]
-            )
-        ]
-    )
+    with os.scandir(directory) as entries:
+        return sum(
+            1
+            for entry in entries
+            # Ignore the following files/directories:
+            if entry.name != "__pycache__"  # Python bytecode
+            and not entry.name.endswith(".py")  # Temp .py files created by TF
+            # Anything else is considered to be created by Rasa
+        )
 
 
 def test_train_temp_files(
-    tmp_path: Path,
+    train_scratch: Tuple[Path, Path],
     monkeypatch: MonkeyPatch,
     default_domain_path: Text,
     default_stories_file: Text,
     default_stack_config: Text,
     default_nlu_data: Text,
 ):
-    (tmp_path / "training").mkdir()
-    (tmp_path / "models").mkdir()
+    training, models = train_scratch
 
-    monkeypatch.setattr(tempfile, "tempdir", tmp_path / "training")
-    output = str(tmp_path / "models")
+    monkeypatch.setattr(tempfile, "tempdir", training)
+    output = str(models)
 
     train(
         default_domain_path,
@@ -109,56 +134,53 @@ def test_train_temp_files(
 
 
 def test_train_core_temp_files(
-    tmp_path: Path,
+    train_scratch: Tuple[Path, Path],
     monkeypatch: MonkeyPatch,
     default_domain_path: Text,
     default_stories_file: Text,
     default_stack_config: Text,
 ):
-    (tmp_path / "training").mkdir()
-    (tmp_path / "models").mkdir()
+    training, models = train_scratch
 
-    monkeypatch.setattr(tempfile, "tempdir", tmp_path / "training")
+    monkeypatch.setattr(tempfile, "tempdir", training)
 
     train_core(
         default_domain_path,
         default_stack_config,
         default_stories_file,
-        output=str(tmp_path / "models"),
+        output=str(models),
     )
 
     assert count_temp_rasa_files(tempfile.tempdir) == 0
 
 
 def test_train_nlu_temp_files(
-    tmp_path: Path,
+    train_scratch: Tuple[Path, Path],
     monkeypatch: MonkeyPatch,
     default_stack_config: Text,
     default_nlu_data: Text,
 ):
-    (tmp_path / "training").mkdir()
-    (tmp_path / "models").mkdir()
+    training, models = train_scratch
 
-    monkeypatch.setattr(tempfile, "tempdir", tmp_path / "training")
+    monkeypatch.setattr(tempfile, "tempdir", training)
 
-    train_nlu(default_stack_config, default_nlu_data, output=str(tmp_path / "models"))
+    train_nlu(default_stack_config, default_nlu_data, output=str(models))
 
     assert count_temp_rasa_files(tempfile.tempdir) == 0
 
 
 def test_train_nlu_wrong_format_error_message(
     capsys: CaptureFixture,
-    tmp_path: Text,
+    train_scratch: Tuple[Path, Path],
     monkeypatch: MonkeyPatch,
     default_stack_config: Text,
     incorrect_nlu_data: Text,
 ):
-    (tmp_path / "training").mkdir()
-    (tmp_path / "models").mkdir()
+    training, models = train_scratch
 
-    monkeypatch.setattr(tempfile, "tempdir", tmp_path / "training")
+    monkeypatch.setattr(tempfile, "tempdir", training)
 
-    train_nlu(default_stack_config, incorrect_nlu_data, output=str(tmp_path / "models"))
+    train_nlu(default_stack_config, incorrect_nlu_data, output=str(models))
 
     captured = capsys.readouterr()
     assert "Please verify the data format" in captured.out
@@ -202,16 +224,15 @@ def test_train_nlu_with_responses_and_domain_no_warns(tmp_path: Path):
 
 def test_train_nlu_no_nlu_file_error_message(
     capsys: CaptureFixture,
-    tmp_path: Text,
+    train_scratch: Tuple[Path, Path],
     monkeypatch: MonkeyPatch,
     default_stack_config: Text,
 ):
-    (tmp_path / "training").mkdir()
-    (tmp_path / "models").mkdir()
+    training, models = train_scratch
 
-    monkeypatch.setattr(tempfile, "tempdir", tmp_path / "training")
+    monkeypatch.setattr(tempfile, "tempdir", training)
 
-    train_nlu(default_stack_config, "", output=str(tmp_path / "models"))
+    train_nlu(default_stack_config, "", output=str(models))
 
     captured = capsys.readouterr()
     assert "No NLU data given" in captured.out
@@ -222,19 +243,15 @@ def test_trained_interpreter_passed_to_core_training(
     monkeypatch: MonkeyPatch, tmp_path: Path, unpacked_trained_moodbot_path: Text
 ):
     # Skip actual NLU training and return trained interpreter path from fixture
-    _train_nlu_with_validated_data = Mock(return_value=unpacked_trained_moodbot_path)
-
-    # Patching is bit more complicated as we have a module `train` and function
-    # with the same name 😬
-    monkeypatch.setattr(
-        sys.modules["rasa.train"],
+    _patch_train(
+        monkeypatch,
         "_train_nlu_with_validated_data",
-        asyncio.coroutine(_train_nlu_with_validated_data),
+        return_value=unpacked_trained_moodbot_path,
     )
 
     # Mock the actual Core training
     _train_core = Mock()
-    monkeypatch.setattr(rasa.core, "train", asyncio.coroutine(_train_core))
+    monkeypatch.setattr(rasa.core, "train", _as_coroutine(_train_core))
 
     train(
         DEFAULT_DOMAIN_PATH_WITH_SLOTS,
@@ -266,7 +283,7 @@ def test_interpreter_of_old_model_passed_to_core_training(
 
     # Mock the actual Core training
     _train_core = Mock()
-    monkeypatch.setattr(rasa.core, "train", asyncio.coroutine(_train_core))
+    monkeypatch.setattr(rasa.core, "train", _as_coroutine(_train_core))
 
     train(
         DEFAULT_DOMAIN_PATH_WITH_SLOTS,
@@ -306,12 +323,7 @@ def test_train_core_autoconfig(
     monkeypatch.setattr(autoconfig, "get_configuration", mocked_get_configuration)
 
     # skip actual core training
-    _train_core_with_validated_data = Mock()
-    monkeypatch.setattr(
-        sys.modules["rasa.train"],
-        "_train_core_with_validated_data",
-        asyncio.coroutine(_train_core_with_validated_data),
-    )
+    _patch_train(monkeypatch, "_train_core_with_validated_data")
 
     # do training
     train_core(
@@ -339,12 +351,7 @@ def test_train_nlu_autoconfig(
     monkeypatch.setattr(autoconfig, "get_configuration", mocked_get_configuration)
 
     # skip actual NLU training
-    _train_nlu_with_validated_data = Mock()
-    monkeypatch.setattr(
-        sys.modules["rasa.train"],
-        "_train_nlu_with_validated_data",
-        asyncio.coroutine(_train_nlu_with_validated_data),
-    )
+    _patch_train(monkeypatch, "_train_nlu_with_validated_data")
 
     # do training
     train_nlu(
@@ -358,46 +365,46 @@ def test_train_nlu_autoconfig(
     assert args[1] == autoconfig.TrainingType.NLU
 
 
-@pytest.mark.parametrize(
-    "result, code, texts_count",
-    [
-        (
-            rasa.model.FingerprintComparisonResult(
-                core=False, nlu=False, nlg=False, force_training=True
-            ),
-            0b1000,
-            1,
+_DRY_RUN_CASES = [
+    (
+        rasa.model.FingerprintComparisonResult(
+            core=False, nlu=False, nlg=False, force_training=True
         ),
-        (
-            rasa.model.FingerprintComparisonResult(
-                core=True, nlu=True, nlg=True, force_training=True
-            ),
-            0b1000,
-            1,
+        0b1000,
+        1,
+    ),
+    (
+        rasa.model.FingerprintComparisonResult(
+            core=True, nlu=True, nlg=True, force_training=True
         ),
-        (
-            rasa.model.FingerprintComparisonResult(
-                core=False, nlu=False, nlg=True, force_training=False
-            ),
-            0b0100,
-            1,
+        0b1000,
+        1,
+    ),
+    (
+        rasa.model.FingerprintComparisonResult(
+            core=False, nlu=False, nlg=True, force_training=False
         ),
-        (
-            rasa.model.FingerprintComparisonResult(
-                core=True, nlu=True, nlg=True, force_training=False
-            ),
-            0b0111,
-            3,
+        0b0100,
+        1,
+    ),
+    (
+        rasa.model.FingerprintComparisonResult(
+            core=True, nlu=True, nlg=True, force_training=False
         ),
-        (
-            rasa.model.FingerprintComparisonResult(
-                core=False, nlu=False, nlg=False, force_training=False
-            ),
-            0,
-            1,
+        0b0111,
+        3,
+    ),
+    (
+        rasa.model.FingerprintComparisonResult(
+            core=False, nlu=False, nlg=False, force_training=False
         ),
-    ],
-)
+        0,
+        1,
+    ),
+]
+
+
+@pytest.mark.parametrize("result, code, texts_count", _DRY_RUN_CASES)
 def test_dry_run_result(
     result: rasa.model.FingerprintComparisonResult, code: int, texts_count: int,
 ):